@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+from click.testing import CliRunner
 import pytest
 
 from wake.wake import Host, Hosts
@@ -10,17 +11,20 @@ from wake.wake import Host, Hosts
 @pytest.fixture(name="config", scope="session")
 def config_fixture(tmp_path_factory: pytest.TempPathFactory, hosts: Hosts) -> Path:
     """A config file with the `hosts` fixture data."""
-    data = ""
-
-    for host in hosts.get_all():
-        data += f'[[ hosts ]]\nname = "{host.name}"\nmac = "{host.mac}"\n'
+    data = "".join(f'[[ hosts ]]\nname = "{host.name}"\nmac = "{host.mac}"\n' for host in hosts.get_all())
 
     file = tmp_path_factory.getbasetemp() / "wake.toml"
-    file.write_text(data, encoding="utf8")
+    file.write_bytes(data.encode("utf8"))
 
     return file
 
 
+@pytest.fixture(name="runner", scope="session")
+def runner_fixture() -> CliRunner:
+    """A shared CLI test runner."""
+    return CliRunner()
+
+
 @pytest.fixture(name="hosts", scope="session")
 def hosts_fixture() -> Hosts:
     """Defined hosts for CLI tests."""
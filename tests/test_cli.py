@@ -1,6 +1,7 @@
-# pylint: disable=missing-module-docstring,missing-function-docstring
+# pylint: disable=missing-module-docstring,missing-function-docstring,too-many-arguments,too-many-positional-arguments
 
 from pathlib import Path
+import socket
 import typing as t
 from unittest.mock import call
 
@@ -41,25 +42,24 @@ def test_build_hosts_valid(capsys: pytest.CaptureFixture):
     assert capsys.readouterr().err == ""
 
 
-def test_cli_version(config: Path):
-    runner = CliRunner()
+def test_cli_version(runner: CliRunner, config: Path):
     result = runner.invoke(cli, ["-c", str(config), "--version"])
     assert result.output.startswith("cli, version")
 
 
 @pytest.mark.parametrize("short_opts", [True, False])
 @pytest.mark.parametrize("verbose", [True, False])
-def test_cli_verbosity(caplog: pytest.LogCaptureFixture, config: Path, verbose: bool, short_opts: bool):
-    CliRunner().invoke(
-        cli, ["-c", str(config), "show", "--help", ("-v" if short_opts else "--verbose") if verbose else ""]
-    )
+def test_cli_verbosity(
+    runner: CliRunner, caplog: pytest.LogCaptureFixture, config: Path, verbose: bool, short_opts: bool
+):
+    runner.invoke(cli, ["-c", str(config), "show", "--help", ("-v" if short_opts else "--verbose") if verbose else ""])
     assert ("DEBUG" in caplog.text) is verbose
 
 
 @pytest.mark.parametrize("short_opts", [True, False])
 @pytest.mark.parametrize("all_hosts", [True, False])
-def test_host(mocker: MockerFixture, config: Path, hosts: Hosts, all_hosts: bool, short_opts: bool):
-    mock_sendto = mocker.patch("wake.cli.socket.socket.sendto")
+def test_host(runner: CliRunner, mocker: MockerFixture, config: Path, hosts: Hosts, all_hosts: bool, short_opts: bool):
+    mock_sendto = mocker.patch.object(socket.socket, "sendto")
     target_hosts = hosts.get_all()
 
     if all_hosts:
@@ -68,7 +68,6 @@ def test_host(mocker: MockerFixture, config: Path, hosts: Hosts, all_hosts: bool
         arg = target_hosts[0].name
         target_hosts = target_hosts[0:-1]
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["-c", str(config), "host", arg])
 
     assert result.exit_code == 0
@@ -77,11 +76,10 @@ def test_host(mocker: MockerFixture, config: Path, hosts: Hosts, all_hosts: bool
 
 
 @pytest.mark.parametrize("all_hosts", [True, False])
-def test_host_no_hosts_to_wake(mocker: MockerFixture, config: Path, all_hosts: bool):
+def test_host_no_hosts_to_wake(runner: CliRunner, mocker: MockerFixture, config: Path, all_hosts: bool):
     missing_config_file = f"{config}x"  # Change file name so config is not found
-    mock_sendto = mocker.patch("wake.cli.socket.socket.sendto")
+    mock_sendto = mocker.patch.object(socket.socket, "sendto")
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["-c", missing_config_file, "host", "--all" if all_hosts else "x"])
 
     assert result.exit_code == 0
@@ -91,11 +89,10 @@ def test_host_no_hosts_to_wake(mocker: MockerFixture, config: Path, all_hosts: b
     mock_sendto.assert_not_called()
 
 
-def test_hosts_known_and_unknown_host(mocker: MockerFixture, config: Path, hosts: Hosts):
-    mock_sendto = mocker.patch("wake.cli.socket.socket.sendto")
+def test_hosts_known_and_unknown_host(runner: CliRunner, mocker: MockerFixture, config: Path, hosts: Hosts):
+    mock_sendto = mocker.patch.object(socket.socket, "sendto")
     known_host = hosts.get_all()[0]
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["-c", str(config), "host", known_host.name, "x"])
 
     assert result.exit_code == 0
@@ -103,21 +100,19 @@ def test_hosts_known_and_unknown_host(mocker: MockerFixture, config: Path, hosts
     mock_sendto.assert_called_once_with(known_host.magic_packet, (known_host.ip, known_host.port))
 
 
-def test_host_mutually_exclusive_params(mocker: MockerFixture, config: Path):
-    mock_sendto = mocker.patch("wake.cli.socket.socket.sendto")
+def test_host_mutually_exclusive_params(runner: CliRunner, mocker: MockerFixture, config: Path):
+    mock_sendto = mocker.patch.object(socket.socket, "sendto")
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["-c", str(config), "host", "--all", "x"])
 
     assert result.output.endswith("\nError: --all cannot be used with named hosts\n")
     mock_sendto.assert_not_called()
 
 
-def test_host_send_fails(mocker: MockerFixture, config: Path, hosts: Hosts):
-    mock_sendto = mocker.patch("wake.cli.socket.socket.sendto", side_effect=OSError)
+def test_host_send_fails(runner: CliRunner, mocker: MockerFixture, config: Path, hosts: Hosts):
+    mock_sendto = mocker.patch.object(socket.socket, "sendto", side_effect=OSError)
     target_host = hosts.get_all()[0]
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["-c", str(config), "host", target_host.name])
 
     assert result.exit_code == 1
@@ -125,7 +120,6 @@ def test_host_send_fails(mocker: MockerFixture, config: Path, hosts: Hosts):
     mock_sendto.assert_called_once_with(target_host.magic_packet, (target_host.ip, target_host.port))
 
 
-def test_show(config: Path, hosts: Hosts):
-    runner = CliRunner()
+def test_show(runner: CliRunner, config: Path, hosts: Hosts):
     result = runner.invoke(cli, ["-c", str(config), "show"])
     assert result.output == f"\n{hosts.table}\n"
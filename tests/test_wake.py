@@ -8,12 +8,28 @@ import pytest
 from wake.wake import Host, Hosts
 
 
+MAC = "AA:BB:CC:00:11:22"
+"""The canonical form of the MAC address used in host tests."""
+
+MAGIC_PACKET = b"\xff" * 6 + bytes.fromhex("AABBCC001122") * 16
+"""The expected magic packet for `MAC`."""
+
+VALIDATE_ERRORS = str(["Invalid IPv4 Address", "Invalid MAC Address", "Invalid name", "Invalid port"])
+"""The expected error message when every `Host` value fails validation."""
+
+
+@pytest.fixture(name="default_hosts", scope="module")
+def default_hosts_fixture() -> list[Host]:
+    """Reusable hosts for collection tests that do not mutate the collection."""
+    return [Host(), Host()]
+
+
 def test_host_name():
     assert Host(name="foo").name == "foo"
 
 
 def test_host_mac():
-    assert Host(mac="AA:BB:CC:00:11:22").mac == "AA:BB:CC:00:11:22"
+    assert Host(mac=MAC).mac == MAC
 
 
 def test_host_ip():
@@ -25,14 +41,11 @@ def test_host_port():
 
 
 def test_host_magic_packet():
-    packet = Host(mac="AA:BB:CC:00:11:22").magic_packet
-    assert packet == (
-        b"\xff\xff\xff\xff\xff\xff"
-        b"\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22"
-        b"\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22"
-        b"\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22"
-        b"\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22\xaa\xbb\xcc\x00\x11\x22"
-    )
+    host = Host(mac=MAC)
+    packet = host.magic_packet
+
+    assert packet == MAGIC_PACKET
+    assert host.magic_packet is packet  # Cached after the first access
 
 
 @pytest.mark.parametrize(
@@ -40,61 +53,46 @@ def test_host_magic_packet():
 )
 def test_host_mac_format(value: str):
     host = Host(mac=value)
-    assert host.mac == "AA:BB:CC:00:11:22"
+    assert host.mac == MAC
 
 
 @pytest.mark.parametrize("valid", [True, False])
 def test_host_validate(valid: bool):
-    error_msg = str(["Invalid IPv4 Address", "Invalid MAC Address", "Invalid name", "Invalid port"])
-
     if valid:
         data = {"ip": "127.0.0.1", "mac": "AA:BB:CC:00:11:22", "name": "foo", "port": 9}
     else:
         data = {"ip": "127.0.0.x", "mac": "ZZ:BB:CC:00:11:22", "name": "", "port": -1}
 
     host = Host(**data)
-    context = does_not_raise() if valid else pytest.raises(ValueError, match=error_msg)
+    context = does_not_raise() if valid else pytest.raises(ValueError, match=VALIDATE_ERRORS)
 
     with context:
         host.validate()
 
 
-@pytest.mark.parametrize("valid", [True, False])
-def test_host__validate_ip(valid: bool):
-    host = Host(ip="127.0.0.1" if valid else "127.0.0.x")
-    context = does_not_raise() if valid else pytest.raises(ValueError, match="Invalid IPv4 Address")
-
-    with context:
-        host._validate_ip()
+@pytest.mark.parametrize(
+    ["value", "valid"],
+    [("127.0.0.1", True), ("127.0.0.x", False), ("127.0.0", False), ("256.0.0.1", False), ("01.0.0.1", False)],
+)
+def test_host__validate_ip(value: str, valid: bool):
+    assert Host(ip=value)._validate_ip() == (None if valid else "Invalid IPv4 Address")
 
 
 @pytest.mark.parametrize(
     ["value", "valid"], [("AA:BB:CC:00:11:22", True), ("ZZ:BB:CC:00:11:22", False), ("AA:BB:CC:00:11:22A", False)]
 )
 def test_host__validate_mac(value: str, valid: bool):
-    host = Host(mac=value)
-    context = does_not_raise() if valid else pytest.raises(ValueError, match="Invalid MAC Address")
-
-    with context:
-        host._validate_mac()
+    assert Host(mac=value)._validate_mac() == (None if valid else "Invalid MAC Address")
 
 
 @pytest.mark.parametrize("valid", [True, False])
 def test_host__validate_name(valid: bool):
-    host = Host(name="foo" if valid else "")
-    context = does_not_raise() if valid else pytest.raises(ValueError, match="Invalid name")
-
-    with context:
-        host._validate_name()
+    assert Host(name="foo" if valid else "")._validate_name() == (None if valid else "Invalid name")
 
 
-@pytest.mark.parametrize(["value", "valid"], [(-1, False), (0, True), (7, True), (65536, False)])
+@pytest.mark.parametrize(["value", "valid"], [(-1, False), (0, True), (7, True), (65536, False), ("9", False)])
 def test_host__validate_port(value: int, valid: bool):
-    host = Host(port=value)
-    context = does_not_raise() if valid else pytest.raises(ValueError, match="Invalid port")
-
-    with context:
-        host._validate_port()
+    assert Host(port=value)._validate_port() == (None if valid else "Invalid port")
 
 
 @pytest.mark.parametrize("value", [None, [], Host(), [Host()]])
@@ -109,8 +107,8 @@ def test_hosts(value: t.Optional[Host | list[Host]]):
         assert hosts.count == len(value)
 
 
-def test_hosts_count():
-    assert Hosts([Host(), Host()]).count == 2
+def test_hosts_count(default_hosts: list[Host]):
+    assert Hosts(default_hosts).count == 2
 
 
 def test_hosts_table():
@@ -126,6 +124,12 @@ def test_hosts_table():
     )
 
 
+def test_hosts_table_empty():
+    result = Hosts().table
+
+    assert result == ("Hostname    MAC Address    IP Address    Port\n----------  -------------  ------------  ------")
+
+
 def test_hosts_add():
     hosts = Hosts(Host())
     hosts.add(Host())
@@ -138,6 +142,5 @@ def test_hosts_get(name: str):
     assert Hosts(host).get(name) == (None if name == "bar" else host)
 
 
-def test_hosts_get_all():
-    values = [Host(), Host()]
-    assert Hosts(values).get_all() == values
+def test_hosts_get_all(default_hosts: list[Host]):
+    assert Hosts(default_hosts).get_all() == default_hosts
@@ -18,7 +18,7 @@ from .wake import Host, Hosts
 HostData = t.TypedDict("HostData", {"name": str, "mac": str, "ip": str, "port": int})
 
 CONFIG_FILE = Path("~/.config/wake.toml").expanduser()
-CONFIG_HOST_PROPERTIES = ["name", "mac", "ip", "port"]
+CONFIG_HOST_PROPERTIES = frozenset(["name", "mac", "ip", "port"])
 
 logger = logging.getLogger(__package__)
 
@@ -37,6 +37,7 @@ def build_hosts(data: t.Optional[dict[str, list[HostData]]]) -> Hosts:
         return hosts
 
     count = len(data["hosts"])
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     for idx, host_data in enumerate(data["hosts"]):
         num = idx + 1
@@ -45,9 +46,10 @@ def build_hosts(data: t.Optional[dict[str, list[HostData]]]) -> Hosts:
         if not name:
             name = f"#{num}"
 
-        logger.debug("Configuring host %s of %s", num, count)
+        if debug:
+            logger.debug("Configuring host %s of %s", num, count)
 
-        unknown_props = set(host_data.keys()).difference(CONFIG_HOST_PROPERTIES)
+        unknown_props = host_data.keys() - CONFIG_HOST_PROPERTIES
 
         for prop in unknown_props:
             del host_data[prop]
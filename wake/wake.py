@@ -4,30 +4,34 @@ wake
 A simple wakeonlan implementation.
 """
 
-from ipaddress import AddressValueError, IPv4Address
-import re
+from operator import attrgetter
 import typing as t
 
-from tabulate import tabulate
-
 
 __all__ = ["Host", "Hosts"]
 
 
-MAC_PATTERN = re.compile(r"^(?:[0-9A-F]{2}([:]))(?:[0-9A-F]{2}\1){4}[0-9A-F]{2}", re.IGNORECASE)
 MAC_REPLACE = [".", "-", ":"]
 MAC_SEPARATOR = ":"
+MAC_STRIP = str.maketrans("", "", "".join(MAC_REPLACE))
+"""Translation table that removes all recognized MAC address separators."""
 
 
 class Host:
     """A network host."""
 
+    __slots__ = ("_name", "_mac", "_ip", "_port", "_validated", "_magic_packet")
+
+    _validators: tuple[str, ...] = ("_validate_ip", "_validate_mac", "_validate_name", "_validate_port")
+    """The validation method names called by `validate`."""
+
     def __init__(self, name: str = "", mac: str = "", ip: str = "255.255.255.255", port: int = 9):
         self._name = name
         self._ip = ip
         self._port = port
         self._validated: bool = False
         self._mac = self._format_mac(mac)
+        self._magic_packet: t.Optional[bytes] = None
 
     @property
     def ip(self) -> str:
@@ -37,7 +41,7 @@ class Host:
     @property
     def mac(self) -> str:
         """The host MAC address."""
-        return self._mac.upper()
+        return self._mac
 
     @property
     def name(self) -> str:
@@ -51,61 +55,67 @@ class Host:
 
     @property
     def magic_packet(self) -> bytes:
-        """The host magic packet."""
-        mac = self.mac.replace(MAC_SEPARATOR, "")
-        data = f'{"FF" * 6}{mac * 16}'
-        packet = bytes.fromhex(data)
+        """The host magic packet.
 
-        return packet
+        The packet is built on first access and cached; the MAC address is immutable after construction.
+        """
+        if self._magic_packet is None:
+            mac = self.mac.replace(MAC_SEPARATOR, "")
+            self._magic_packet = b"\xff" * 6 + bytes.fromhex(mac) * 16
+
+        return self._magic_packet
 
     def validate(self) -> None:
         """Validate a host.
 
-        Call all object methods that begin with '_validate_' to validate host. Validation methods should raise
-        `ValueError` on an error. All errors will be raised together after every validation method has run.
+        Call each method named in `_validators` to validate host. Validation methods return an error message on an
+        error and `None` otherwise. All errors will be raised together after every validation method has run.
 
         :raises ValueError: One or more values failed validation.
         """
         errors = []
 
-        for attr in dir(self):
-            if attr.startswith("_validate_") and callable(getattr(self, attr)):
-                try:
-                    getattr(self, attr)()
-                except ValueError as exc:
-                    errors.append(str(exc))
+        for attr in self._validators:
+            error = getattr(self, attr)()
+
+            if error is not None:
+                errors.append(error)
 
         if errors:
             raise ValueError(errors)
 
     def _format_mac(self, value: str) -> str:
-        for char in MAC_REPLACE:
-            if char in value:
-                value = value.replace(char, "")
+        value = value.translate(MAC_STRIP).upper()
 
         if len(value) == 12:
             value = MAC_SEPARATOR.join(value[i : i + 2] for i in range(0, 12, 2))
 
         return value
 
-    def _validate_ip(self) -> None:
+    def _validate_ip(self) -> t.Optional[str]:
+        octets = self.ip.split(".")
+        valid = len(octets) == 4 and all(
+            octet.isascii() and octet.isdigit() and int(octet) <= 255 and (octet == "0" or octet[0] != "0")
+            for octet in octets
+        )
+
+        return None if valid else "Invalid IPv4 Address"
+
+    def _validate_mac(self) -> t.Optional[str]:
+        mac = self._mac.replace(MAC_SEPARATOR, "")
+
         try:
-            IPv4Address(self.ip)
-        except AddressValueError as exc:
-            raise ValueError("Invalid IPv4 Address") from exc
+            valid = len(mac) == 12 and len(bytes.fromhex(mac)) == 6
+        except ValueError:
+            valid = False
 
-    def _validate_mac(self) -> None:
-        match = MAC_PATTERN.match(self._mac)
-        if not match:
-            raise ValueError("Invalid MAC Address")
+        return None if valid else "Invalid MAC Address"
 
-    def _validate_name(self) -> None:
-        if self.name == "":
-            raise ValueError("Invalid name")
+    def _validate_name(self) -> t.Optional[str]:
+        return None if self.name else "Invalid name"
 
-    def _validate_port(self) -> None:
-        if not 0 <= self.port <= 65535:
-            raise ValueError("Invalid port")
+    def _validate_port(self) -> t.Optional[str]:
+        return None if isinstance(self._port, int) and 0 <= self._port <= 65535 else "Invalid port"
 
 
 class Hosts:
@@ -114,16 +124,20 @@ class Hosts:
     :param hosts: Zero or more `Host`s to add to the collection.
     """
 
-    _hosts: list[Host] = []
-    _columns: list[str] = ["Hostname", "MAC Address", "IP Address", "Port"]
+    __slots__ = ("_hosts", "_index")
+
+    _columns: tuple[str, ...] = ("Hostname", "MAC Address", "IP Address", "Port")
     """The column names for the hosts table."""
-    _fields: list[str] = ["name", "mac", "ip", "port"]
+    _fields: tuple[str, ...] = ("name", "mac", "ip", "port")
     """The `Host` attribute name for each column in the hosts table."""
+    _getter = attrgetter(*_fields)
+    """Fetches the `Host` attribute value for each column in the hosts table."""
 
     def __init__(self, hosts: t.Optional[Host | list[Host]] = None):
         if hosts is None:
             hosts = []
         self._hosts = [hosts] if isinstance(hosts, Host) else hosts
+        self._index = {host.name.lower(): host for host in self._hosts}
 
     @property
     def count(self) -> int:
@@ -132,29 +146,45 @@ class Hosts:
 
     @property
     def table(self) -> str:
-        """Table display of all hosts in the collection."""
-        data = [self._columns]
-
-        for host in self._hosts:
-            row = []
+        """Table display of all hosts in the collection.
 
-            for field in self._fields:
-                row.append(getattr(host, field))
-
-            data.append(row)
-
-        return tabulate(data, headers="firstrow", tablefmt="simple")
+        Columns are fixed-width and separated by two spaces; numeric columns are right-aligned.
+        """
+        raw_columns = list(zip(*(self._getter(host) for host in self._hosts))) or [()] * len(self._fields)
+        columns = [tuple(str(value) for value in column) for column in raw_columns]
+        numeric = [bool(column) and all(isinstance(value, int) for value in column) for column in raw_columns]
+        widths = [
+            max([len(header) + 2] + [len(value) for value in column]) for header, column in zip(self._columns, columns)
+        ]
+
+        lines = [
+            "  ".join(
+                header.rjust(width) if num else header.ljust(width)
+                for header, width, num in zip(self._columns, widths, numeric)
+            ),
+            "  ".join("-" * width for width in widths),
+        ]
+
+        for row in zip(*columns):
+            lines.append(
+                "  ".join(
+                    value.rjust(width) if num else value.ljust(width) for value, width, num in zip(row, widths, numeric)
+                )
+            )
+
+        return "\n".join(line.rstrip() for line in lines)
 
     def add(self, host: Host) -> None:
         """Add a host to the collection."""
         self._hosts.append(host)
+        self._index[host.name.lower()] = host
 
     def get(self, name: str) -> t.Optional[Host]:
-        """Get a host by name.
+        """Get a host by name. Names are matched case-insensitively.
 
         :param name: The name of the host to get.
         """
-        return next((host for host in self._hosts if host.name.lower() == name.lower()), None)
+        return self._index.get(name.lower())
 
     def get_all(self) -> list[Host]:
         """Get all hosts in the collection."""